@@ -5,7 +5,7 @@ Synchronization operations inside the IR.
 from collections import defaultdict
 
 from devito.data import FULL
-from devito.tools import Pickable, filter_ordered
+from devito.tools import Pickable
 from devito.types import DimensionTuple
 
 __all__ = ['WaitLock', 'ReleaseLock', 'WithLock', 'FetchUpdate', 'PrefetchUpdate',
@@ -18,6 +18,11 @@ class IMask(DimensionTuple):
 
 class SyncOp(Pickable):
 
+    # SyncOps are created in large numbers while lowering Clusters, so a
+    # fixed attribute layout pays off both in memory and in access time
+    __slots__ = ('handle', 'target', 'tindex', 'function', 'findex', 'dim',
+                 'size', 'origin', '_hash')
+
     __rargs__ = ('handle', 'target')
     __rkwargs__ = ('tindex', 'function', 'findex', 'dim', 'size', 'origin')
 
@@ -33,19 +38,32 @@ class SyncOp(Pickable):
         self.size = size
         self.origin = origin
 
+        self._hash = None
+
     def __eq__(self, other):
+        if self is other:
+            return True
+        # The identity checks come first as they are the cheapest; the
+        # structural comparisons, which may recur into sympy expressions,
+        # only run if everything else matches
         return (type(self) is type(other) and
-                self.handle == other.handle and
                 self.target is other.target and
-                self.tindex == other.tindex and
                 self.function is other.function and
-                self.findex == other.findex and
                 self.dim is other.dim and
                 self.size == other.size and
+                self.handle == other.handle and
+                self.tindex == other.tindex and
+                self.findex == other.findex and
                 self.origin == other.origin)
 
     def __hash__(self):
-        return id(self)
+        # Normalizing and scheduling Clusters hashes the same SyncOps over and
+        # over, so the hash is computed once and cached on the instance
+        if self._hash is None:
+            self._hash = hash((type(self), self.handle, self.target, self.tindex,
+                               self.function, self.findex, self.dim, self.size,
+                               self.origin))
+        return self._hash
 
     def __repr__(self):
         return "%s<%s>" % (self.__class__.__name__, self.handle)
@@ -62,6 +80,16 @@ class SyncOp(Pickable):
 
 class SyncCopyOut(SyncOp):
 
+    __slots__ = ('_locked',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # The subset of target Dimensions spanned by the lock, precomputed
+        # here once since it's needed every time the imask is built
+        self._locked = frozenset(d for d in self.target.dimensions
+                                 if d.root in self.lock.locked_dimensions)
+
     def __repr__(self):
         return "%s<%s->%s>" % (self.__class__.__name__, self.target, self.function)
 
@@ -69,14 +97,18 @@ class SyncCopyOut(SyncOp):
 
     @property
     def imask(self):
-        ret = [self.handle.indices[d] if d.root in self.lock.locked_dimensions else FULL
-               for d in self.target.dimensions]
-        return IMask(*ret, getters=self.target.dimensions, function=self.function,
+        dimensions = self.target.dimensions
+        locked = self._locked
+        indices = self.handle.indices
+        ret = tuple(indices[d] if d in locked else FULL for d in dimensions)
+        return IMask(*ret, getters=dimensions, function=self.function,
                      findex=self.findex)
 
 
 class SyncCopyIn(SyncOp):
 
+    __slots__ = ()
+
     def __repr__(self):
         return "%s<%s->%s>" % (self.__class__.__name__, self.function, self.target)
 
@@ -84,51 +116,71 @@ class SyncCopyIn(SyncOp):
 
     @property
     def imask(self):
-        ret = [(self.tindex, self.size) if d.root is self.dim.root else FULL
-               for d in self.target.dimensions]
-        return IMask(*ret, getters=self.target.dimensions, function=self.function,
+        dimensions = self.target.dimensions
+        root = self.dim.root
+        fetch = (self.tindex, self.size)
+        ret = tuple(fetch if d.root is root else FULL for d in dimensions)
+        return IMask(*ret, getters=dimensions, function=self.function,
                      findex=self.findex)
 
 
 class WaitLock(SyncCopyOut):
-    pass
+    __slots__ = ()
 
 
 class WithLock(SyncCopyOut):
-    pass
+    __slots__ = ()
 
 
 class ReleaseLock(SyncCopyOut):
-    pass
+    __slots__ = ()
 
 
 class FetchUpdate(SyncCopyIn):
-    pass
+    __slots__ = ()
 
 
 class PrefetchUpdate(SyncCopyIn):
-    pass
+    __slots__ = ()
 
 
 def normalize_syncs(*args):
     if not args:
         return
-    if len(args) == 1:
-        return args[0]
+
+    # Empty and duplicate inputs contribute nothing to the merge, so they
+    # are dropped upfront; like the single-input case, they require neither
+    # deduplication nor validation
+    filtered = []
+    for a in args:
+        if a and not any(a is b for b in filtered):
+            filtered.append(a)
+
+    if not filtered:
+        return {}
+    if len(filtered) == 1:
+        return filtered[0]
 
     syncs = defaultdict(list)
-    for _dict in args:
+    for _dict in filtered:
         for k, v in _dict.items():
             syncs[k].extend(v)
 
-    syncs = {k: filter_ordered(v) for k, v in syncs.items()}
+    processed = {}
+    for k, v in syncs.items():
+        # SyncOps are hashable, so duplicates can be dropped through a plain
+        # dict, which also preserves the insertion order
+        unique = list(dict.fromkeys(v))
 
-    for v in syncs.values():
-        waitlocks = [s for s in v if isinstance(s, WaitLock)]
-        withlocks = [s for s in v if isinstance(s, WithLock)]
+        waitlocks = withlocks = False
+        for s in unique:
+            waitlocks |= isinstance(s, WaitLock)
+            withlocks |= isinstance(s, WithLock)
 
         if waitlocks and withlocks:
             # We do not allow mixing up WaitLock and WithLock ops
             raise ValueError("Incompatible SyncOps")
 
-    return syncs
+        processed[k] = unique
+
+    return processed
@@ -26,9 +26,11 @@ class LangMeta(type):
     mapper = {}
 
     def __getitem__(self, k):
-        if k not in self.mapper:
+        # Single lookup -- this is on the hot path of pragma generation
+        try:
+            return self.mapper[k]
+        except KeyError:
             raise NotImplementedError("Missing required mapping for `%s`" % k)
-        return self.mapper[k]
 
 
 class LangBB(object, metaclass=LangMeta):
@@ -238,105 +240,113 @@ class DeviceAwareMixin(object):
         Despite not all of these are applicable to all target languages, there
         is sufficient reuse to implement the logic as a single method.
         """
+        return _initialize(iet, self, options)
+
+    def _is_offloadable(self, iet):
+        """
+        True if the IET computation is offloadable to device, False otherwise.
+        """
+        expressions = FindNodes(Expression).visit(iet)
+        if any(not is_on_device(e.write, self.gpu_fit) for e in expressions):
+            return False
+
+        functions = FindSymbols().visit(iet)
+        buffers = [f for f in functions if f.is_Array and f._mem_mapped]
+        hostfuncs = [f for f in functions if not is_on_device(f, self.gpu_fit)]
+        return not (buffers and hostfuncs)
 
-        @singledispatch
-        def _initialize(iet):
-            return iet, {}
-
-        @_initialize.register(EntryFunction)
-        def _(iet):
-            assert iet.body.is_CallableBody
-
-            # TODO: we need to pick the rank from `comm_shm`, not `comm`,
-            # so that we have nranks == ngpus (as long as the user has launched
-            # the right number of MPI processes per node given the available
-            # number of GPUs per node)
-
-            objcomm = None
-            for i in iet.parameters:
-                if isinstance(i, MPICommObject):
-                    objcomm = i
-                    break
-            if objcomm is None and options['mpi']:
-                # Time to inject `objcomm`. If it's not here, it simply means
-                # there's no halo exchanges in the Operator, but we now need it
-                # nonetheless to perform the rank-GPU assignment
-                for i in iet.parameters:
-                    try:
-                        objcomm = i.grid.distributor._obj_comm
-                        break
-                    except AttributeError:
-                        pass
-                assert objcomm is not None
-
-            devicetype = as_list(self.lang[self.platform])
-            deviceid = self.deviceid
 
+@singledispatch
+def _initialize(iet, transformer, options):
+    # Note: the single-dispatch registry is built once at module level, rather
+    # than upon each `DeviceAwareMixin.initialize` call
+    return iet, {}
+
+
+@_initialize.register(EntryFunction)
+def _(iet, transformer, options):
+    assert iet.body.is_CallableBody
+
+    # TODO: we need to pick the rank from `comm_shm`, not `comm`,
+    # so that we have nranks == ngpus (as long as the user has launched
+    # the right number of MPI processes per node given the available
+    # number of GPUs per node)
+
+    lang = transformer.lang
+
+    objcomm = None
+    for i in iet.parameters:
+        if isinstance(i, MPICommObject):
+            objcomm = i
+            break
+    if objcomm is None and options['mpi']:
+        # Time to inject `objcomm`. If it's not here, it simply means
+        # there's no halo exchanges in the Operator, but we now need it
+        # nonetheless to perform the rank-GPU assignment
+        for i in iet.parameters:
             try:
-                lang_init = [self.lang['init'](devicetype)]
-            except TypeError:
-                # Not all target languages need to be explicitly initialized
-                lang_init = []
+                objcomm = i.grid.distributor._obj_comm
+                break
+            except AttributeError:
+                pass
+        assert objcomm is not None
 
-            if objcomm is not None:
-                rank = Symbol(name='rank')
-                rank_decl = DummyExpr(rank, 0)
-                rank_init = Call('MPI_Comm_rank', [objcomm, Byref(rank)])
+    devicetype = as_list(lang[transformer.platform])
+    deviceid = transformer.deviceid
 
-                ngpus, call_ngpus = self.lang._get_num_devices(self.platform)
+    try:
+        lang_init = [lang['init'](devicetype)]
+    except TypeError:
+        # Not all target languages need to be explicitly initialized
+        lang_init = []
 
-                osdd_then = self.lang['set-device']([deviceid] + devicetype)
-                osdd_else = self.lang['set-device']([rank % ngpus] + devicetype)
+    if objcomm is not None:
+        rank = Symbol(name='rank')
+        rank_decl = DummyExpr(rank, 0)
+        rank_init = Call('MPI_Comm_rank', [objcomm, Byref(rank)])
 
-                body = lang_init + [Conditional(
-                    CondNe(deviceid, -1),
-                    osdd_then,
-                    List(body=[rank_decl, rank_init, call_ngpus, osdd_else]),
-                )]
+        ngpus, call_ngpus = lang._get_num_devices(transformer.platform)
 
-                header = c.Comment('Begin of %s+MPI setup' % self.lang['name'])
-                footer = c.Comment('End of %s+MPI setup' % self.lang['name'])
-            else:
-                body = lang_init + [Conditional(
-                    CondNe(deviceid, -1),
-                    self.lang['set-device']([deviceid] + devicetype)
-                )]
+        osdd_then = lang['set-device']([deviceid] + devicetype)
+        osdd_else = lang['set-device']([rank % ngpus] + devicetype)
 
-                header = c.Comment('Begin of %s setup' % self.lang['name'])
-                footer = c.Comment('End of %s setup' % self.lang['name'])
+        body = lang_init + [Conditional(
+            CondNe(deviceid, -1),
+            osdd_then,
+            List(body=[rank_decl, rank_init, call_ngpus, osdd_else]),
+        )]
 
-            init = List(header=header, body=body, footer=footer)
-            iet = iet._rebuild(body=iet.body._rebuild(init=init))
+        header = c.Comment('Begin of %s+MPI setup' % lang['name'])
+        footer = c.Comment('End of %s+MPI setup' % lang['name'])
+    else:
+        body = lang_init + [Conditional(
+            CondNe(deviceid, -1),
+            lang['set-device']([deviceid] + devicetype)
+        )]
 
-            return iet, {}
+        header = c.Comment('Begin of %s setup' % lang['name'])
+        footer = c.Comment('End of %s setup' % lang['name'])
 
-        @_initialize.register(AsyncCallable)
-        def _(iet):
-            devicetype = as_list(self.lang[self.platform])
-            deviceid = self.deviceid
+    init = List(header=header, body=body, footer=footer)
+    iet = iet._rebuild(body=iet.body._rebuild(init=init))
 
-            init = Conditional(
-                CondNe(deviceid, -1),
-                self.lang['set-device']([deviceid] + devicetype)
-            )
-            iet = iet._rebuild(body=iet.body._rebuild(init=init))
+    return iet, {}
 
-            return iet, {}
 
-        return _initialize(iet)
+@_initialize.register(AsyncCallable)
+def _(iet, transformer, options):
+    lang = transformer.lang
 
-    def _is_offloadable(self, iet):
-        """
-        True if the IET computation is offloadable to device, False otherwise.
-        """
-        expressions = FindNodes(Expression).visit(iet)
-        if any(not is_on_device(e.write, self.gpu_fit) for e in expressions):
-            return False
+    devicetype = as_list(lang[transformer.platform])
+    deviceid = transformer.deviceid
 
-        functions = FindSymbols().visit(iet)
-        buffers = [f for f in functions if f.is_Array and f._mem_mapped]
-        hostfuncs = [f for f in functions if not is_on_device(f, self.gpu_fit)]
-        return not (buffers and hostfuncs)
+    init = Conditional(
+        CondNe(deviceid, -1),
+        lang['set-device']([deviceid] + devicetype)
+    )
+    iet = iet._rebuild(body=iet.body._rebuild(init=init))
+
+    return iet, {}
 
 
 class Sections(tuple):
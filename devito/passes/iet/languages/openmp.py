@@ -1,3 +1,5 @@
+import os
+
 from packaging.version import Version
 
 import cgen as c
@@ -15,9 +17,9 @@ from devito.passes.iet.parpragma import (PragmaSimdTransformer, PragmaShmTransfo
                                          PragmaDeviceAwareTransformer, PragmaLangBB,
                                          PragmaTransfer)
 from devito.passes.iet.languages.C import CBB
-from devito.passes.iet.languages.utils import make_clause_reduction
+from devito.passes.iet.languages.utils import make_clause_reduction, make_pragma
 from devito.symbolics import CondEq, DefFunction
-from devito.tools import filter_ordered
+from devito.tools import filter_ordered, frozendict
 
 __all__ = ['SimdOmpizer', 'Ompizer', 'OmpIteration', 'OmpRegion',
            'DeviceOmpizer', 'DeviceOmpIteration', 'DeviceOmpDataManager',
@@ -29,11 +31,20 @@ class OmpRegion(ParallelBlock):
     @classmethod
     def _make_header(cls, nthreads, private=None):
         private = ('private(%s)' % ','.join(private)) if private else ''
-        return c.Pragma('omp parallel num_threads(%s) %s' % (nthreads.name, private))
+        # `proc_bind(close)` pins the team threads to adjacent places, which
+        # improves NUMA locality when the user sets OMP_PLACES/OMP_PROC_BIND
+        return make_pragma('omp parallel num_threads(%s) proc_bind(close) %s'
+                           % (nthreads.name, private))
 
 
 class OmpIteration(ParallelIteration):
 
+    _clauses_cache = {}
+    """
+    The clauses stemming from scalar arguments are the same across Operators,
+    so they are only ever built once and then simply retrieved from this cache.
+    """
+
     @classmethod
     def _make_construct(cls, parallel=False, **kwargs):
         if parallel:
@@ -44,16 +55,36 @@ class OmpIteration(ParallelIteration):
     @classmethod
     def _make_clauses(cls, ncollapse=None, chunk_size=None, nthreads=None,
                       reduction=None, schedule=None, **kwargs):
-        clauses = []
-
-        clauses.append('collapse(%d)' % (ncollapse or 1))
-
-        if chunk_size is not False:
-            clauses.append('schedule(%s,%s)' % (schedule or 'dynamic',
-                                                chunk_size or 1))
-
-        if nthreads:
-            clauses.append('num_threads(%s)' % nthreads)
+        # With OMP_SCHEDULE set, the user takes control of the scheduling,
+        # so the compiler heuristics are overridden with `schedule(runtime)`
+        deferred = 'OMP_SCHEDULE' in os.environ
+
+        key = (cls, ncollapse, chunk_size, nthreads, schedule, deferred)
+        try:
+            clauses = cls._clauses_cache[key]
+        except KeyError:
+            clauses = ['collapse(%d)' % (ncollapse or 1)]
+
+            if chunk_size is not False:
+                if deferred:
+                    clauses.append('schedule(runtime)')
+                elif schedule == 'static' and chunk_size is None:
+                    # With static scheduling, explicitly requesting unit-sized
+                    # chunks would round-robin the iterations across threads;
+                    # leaving the chunk size up to the runtime instead assigns
+                    # one contiguous block per thread, which maximizes locality.
+                    # This is the typical scenario of low-op-count FD loops
+                    clauses.append('schedule(static)')
+                else:
+                    clauses.append('schedule(%s,%s)' % (schedule or 'dynamic',
+                                                        chunk_size or 1))
+
+            if nthreads:
+                clauses.append('num_threads(%s)' % nthreads)
+
+            clauses = cls._clauses_cache[key] = tuple(clauses)
+
+        clauses = list(clauses)
 
         if reduction:
             clauses.append(make_clause_reduction(reduction))
@@ -103,9 +134,19 @@ class ThreadedProdder(Conditional, Prodder):
 
     _traversable = []
 
+    _condition = None
+    """
+    The `omp_get_thread_num() == 0` guard. It is invariant, so it's built
+    lazily (Ompizer isn't defined yet at class-creation time) and then
+    shared across all instances.
+    """
+
     def __init__(self, prodder, arguments=None):
         # Atomic-ize any single-thread Prodders in the parallel tree
-        condition = CondEq(DefFunction(Ompizer.lang['thread-num']().name), 0)
+        condition = ThreadedProdder._condition
+        if condition is None:
+            condition = CondEq(DefFunction(Ompizer.lang['thread-num']().name), 0)
+            ThreadedProdder._condition = condition
 
         # Prod within a while loop until all communications have completed
         # In other words, the thread delegated to prodding is entrapped for as long
@@ -135,10 +176,12 @@ class OmpBB(LangBB):
             Call('omp_get_thread_num', retobj=retobj),
         # Pragmas
         'simd-for': c.Pragma('omp simd'),
-        'simd-for-aligned': lambda i, j: c.Pragma('omp simd aligned(%s:%d)' % (i, j)),
+        'simd-for-aligned': lambda i, j: make_pragma('omp simd aligned(%s:%d)' % (i, j)),
         'atomic': c.Pragma('omp atomic update')
     }
     mapper.update(CBB.mapper)
+    # The mapper is read-only after construction, so freeze it
+    mapper = frozendict(mapper)
 
     Region = OmpRegion
     HostIteration = OmpIteration
@@ -159,23 +202,23 @@ class DeviceOmpBB(OmpBB, PragmaLangBB):
             Call('omp_set_default_device', args),
         # Pragmas
         'map-enter-to': lambda i, j:
-            c.Pragma('omp target enter data map(to: %s%s)' % (i, j)),
+            make_pragma('omp target enter data map(to: %s%s)' % (i, j)),
         'map-enter-alloc': lambda i, j:
-            c.Pragma('omp target enter data map(alloc: %s%s)' % (i, j)),
+            make_pragma('omp target enter data map(alloc: %s%s)' % (i, j)),
         'map-update': lambda i, j:
-            c.Pragma('omp target update from(%s%s)' % (i, j)),
+            make_pragma('omp target update from(%s%s)' % (i, j)),
         'map-update-host': lambda i, j:
-            c.Pragma('omp target update from(%s%s)' % (i, j)),
+            make_pragma('omp target update from(%s%s)' % (i, j)),
         'map-update-device': lambda i, j:
-            c.Pragma('omp target update to(%s%s)' % (i, j)),
+            make_pragma('omp target update to(%s%s)' % (i, j)),
         'map-release': lambda i, j:
-            c.Pragma('omp target exit data map(release: %s%s)' % (i, j)),
+            make_pragma('omp target exit data map(release: %s%s)' % (i, j)),
         'map-release-if': lambda i, j, k:
-            c.Pragma('omp target exit data map(release: %s%s) if(%s)' % (i, j, k)),
+            make_pragma('omp target exit data map(release: %s%s) if(%s)' % (i, j, k)),
         'map-exit-delete': lambda i, j:
-            c.Pragma('omp target exit data map(delete: %s%s)' % (i, j)),
+            make_pragma('omp target exit data map(delete: %s%s)' % (i, j)),
         'map-exit-delete-if': lambda i, j, k:
-            c.Pragma('omp target exit data map(delete: %s%s) if(%s)' % (i, j, k)),
+            make_pragma('omp target exit data map(delete: %s%s) if(%s)' % (i, j, k)),
         'memcpy-to-device': lambda i, j, k:
             Call('omp_target_memcpy', [i, j, k, 0, 0,
                                        DefFunction('omp_get_device_num'),
@@ -191,6 +234,7 @@ class DeviceOmpBB(OmpBB, PragmaLangBB):
         'device-free': lambda i, j:
             Call('omp_target_free', (i, j))
     })
+    mapper = frozendict(mapper)
 
     # NOTE: Work around clang>=10 issue concerning offloading arrays declared
     # with an `__attribute__(aligned(...))` qualifier
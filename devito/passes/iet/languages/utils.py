@@ -1,6 +1,19 @@
+import cgen as c
+
 from devito.data import FULL
+from devito.tools import memoized_func
+
+__all__ = ['make_clause_reduction', 'make_pragma']
+
 
-__all__ = ['make_clause_reduction']
+@memoized_func
+def make_pragma(text):
+    """
+    Return a cgen.Pragma for the given text. Pragmas are immutable and the
+    same few strings recur over and over across Operators, so the objects
+    are interned rather than rebuilt at each request.
+    """
+    return c.Pragma(text)
 
 
 def make_clause_reduction(reductions):
@@ -9,19 +22,20 @@ def make_clause_reduction(reductions):
     2-tuples `(symbol, ir.Operation)`.
     """
     args = []
+    ranges = {}
     for i, r in reductions:
         if i.is_Indexed:
             f = i.function
-            bounds = []
-            for k, d in zip(i.indices, f.dimensions):
-                if k.is_Number:
-                    bounds.append('[%s]' % k)
-                else:
-                    # Languages such as OpenMP and OpenACC expect a range
-                    # as input to a reduction clause, such as
-                    # `reduction(+:f[0:f_vec->size[1]])`
-                    bounds.append('[0:%s]' % f._C_get_field(FULL, d).size)
-            args.append('%s%s' % (i.name, ''.join(bounds)))
+            if f not in ranges:
+                # Pre-build the range bounds once per function, rather than
+                # once per reduction argument. Languages such as OpenMP and
+                # OpenACC expect a range as input to a reduction clause, such
+                # as `reduction(+:f[0:f_vec->size[1]])`
+                ranges[f] = {d: '[0:%s]' % f._C_get_field(FULL, d).size
+                             for d in f.dimensions}
+            bounds = ''.join('[%s]' % k if k.is_Number else ranges[f][d]
+                             for k, d in zip(i.indices, f.dimensions))
+            args.append('%s%s' % (i.name, bounds))
         else:
             args.append(str(i))
     return 'reduction(%s:%s)' % (r.name, ','.join(args))
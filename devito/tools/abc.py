@@ -92,6 +92,10 @@ class Signer(object):
 
 class Reconstructable(object):
 
+    # No instance state of its own; this also allows subclasses to define
+    # `__slots__` effectively, if they wish to
+    __slots__ = ()
+
     __rargs__ = ()
     """
     The positional arguments to reconstruct the object.
@@ -163,6 +167,8 @@ class Pickable(Reconstructable):
     ``__reduce_ex__ = Pickable.__reduce_ex__`` depending on the MRO.
     """
 
+    __slots__ = ()
+
     @property
     def _pickle_rargs(self):
         """
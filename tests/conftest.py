@@ -154,11 +154,16 @@ def parallel(item):
 
 
 def pytest_configure(config):
-    """Register an additional marker."""
+    """Register additional markers."""
     config.addinivalue_line(
         "markers",
         "parallel(mode): mark test to run in parallel"
     )
+    config.addinivalue_line(
+        "markers",
+        "slow: mark test as wall-time dominant, e.g. to defer it to a "
+        "separate `pytest -m slow` run under pytest-xdist"
+    )
 
 
 def pytest_runtest_setup(item):
@@ -670,6 +670,22 @@ class TestNodeParallelism(object):
         assert not iterations[3].is_Affine
         assert 'schedule(dynamic,chunk_size)' in iterations[3].pragmas[0].value
 
+    def test_scheduling_runtime_override(self, monkeypatch):
+        """
+        Setting OMP_SCHEDULE defers the scheduling decision to the OpenMP
+        runtime via `schedule(runtime)`.
+        """
+        monkeypatch.setenv('OMP_SCHEDULE', 'dynamic,64')
+
+        grid = Grid(shape=(11, 11))
+
+        u = TimeFunction(name='u', grid=grid, save=5, space_order=0)
+
+        op = Operator(Eq(u.forward, u + 1), opt='openmp')
+
+        iterations = FindNodes(Iteration).visit(op)
+        assert 'schedule(runtime)' in iterations[1].pragmas[0].value
+
     @skipif('cpu64-icc')
     @pytest.mark.parametrize('so', [0, 1, 2])
     @pytest.mark.parametrize('dim', [0, 1, 2])
@@ -856,7 +872,7 @@ class TestNodeParallelism(object):
         op = Operator(eq, opt=('advanced', {'openmp': True}))
         iterations = FindNodes(Iteration).visit(op)
 
-        assert 'omp for collapse(1) schedule(static,1)' in iterations[0].pragmas[0].value
+        assert 'omp for collapse(1) schedule(static)' in iterations[0].pragmas[0].value
         assert 'omp simd' in iterations[1].pragmas[0].value
         assert 'omp simd' in iterations[3].pragmas[0].value
 
@@ -1079,7 +1095,10 @@ class TestNestedParallelism(object):
         iterations = FindNodes(Iteration).visit(op)
 
         ompfor_string = "".join(['omp for collapse(', collapsed, ')'])
-        scheduling_string = "".join([' schedule(', scheduling, ',1)'])
+        if scheduling == 'static':
+            scheduling_string = ' schedule(static)'
+        else:
+            scheduling_string = "".join([' schedule(', scheduling, ',1)'])
 
         assert iterations[1].pragmas[0].value == "".join([ompfor_string,
                                                           scheduling_string])
@@ -1,4 +1,4 @@
-from math import sin, floor
+from math import sin
 
 import numpy as np
 import pytest
@@ -14,32 +14,61 @@ from examples.seismic.acoustic import AcousticWaveSolver
 import scipy.sparse
 
 
+def unit_ramp(shape):
+    """A 0. to 1. ramp along the first dimension, broadcastable to `shape`."""
+    # float32, like the Functions this fills -- no transient float64 arrays,
+    # no downcast on assignment
+    ramp = np.linspace(0., 1., shape[0], dtype=np.float32)
+    return ramp.reshape((-1,) + (1,)*(len(shape) - 1))
+
+
+_grids = {}
+"""
+Grids are immutable, so the helpers below share one Grid per shape across
+tests and parametrizations, rather than rebuilding it each time. The
+Functions themselves are still created afresh, as tests mutate their data.
+"""
+
+
+def unit_grid(shape):
+    try:
+        return _grids[shape]
+    except KeyError:
+        return _grids.setdefault(shape, Grid(shape=shape))
+
+
 def unit_box(name='a', shape=(11, 11), grid=None):
     """Create a field with value 0. to 1. in each dimension"""
-    grid = grid or Grid(shape=shape)
+    grid = grid or unit_grid(shape)
     a = Function(name=name, grid=grid)
-    dims = tuple([np.linspace(0., 1., d) for d in shape])
-    a.data[:] = np.meshgrid(*dims)[1]
+    a.data[:] = unit_ramp(shape)
     return a
 
 
 def unit_box_time(name='a', shape=(11, 11)):
     """Create a field with value 0. to 1. in each dimension"""
-    grid = Grid(shape=shape)
+    grid = unit_grid(shape)
     a = TimeFunction(name=name, grid=grid, time_order=1)
-    dims = tuple([np.linspace(0., 1., d) for d in shape])
-    a.data[0, :] = np.meshgrid(*dims)[1]
-    a.data[1, :] = np.meshgrid(*dims)[1]
+    ramp = unit_ramp(shape)
+    a.data[0, :] = ramp
+    a.data[1, :] = ramp
     return a
 
 
+def linear_coordinates(ranges, npoints):
+    """Build an `(npoints, len(ranges))` coordinate array, with `npoints`
+    equally spaced values along each coordinate range.
+    """
+    return np.stack([np.linspace(r[0], r[1], npoints, dtype=np.float32)
+                     for r in ranges], axis=1)
+
+
 def points(grid, ranges, npoints, name='points'):
     """Create a set of sparse points from a set of coordinate
     ranges for each spatial dimension.
     """
     points = SparseFunction(name=name, grid=grid, npoint=npoints)
-    for i, r in enumerate(ranges):
-        points.coordinates.data[:, i] = np.linspace(r[0], r[1], npoints)
+    points.coordinates.data[:] = linear_coordinates(ranges, npoints)
     return points
 
 
@@ -48,26 +77,19 @@ def time_points(grid, ranges, npoints, name='points', nt=10):
     ranges for each spatial dimension.
     """
     points = SparseTimeFunction(name=name, grid=grid, npoint=npoints, nt=nt)
-    for i, r in enumerate(ranges):
-        points.coordinates.data[:, i] = np.linspace(r[0], r[1], npoints)
+    points.coordinates.data[:] = linear_coordinates(ranges, npoints)
     return points
 
 
 def a(shape=(11, 11)):
-    grid = Grid(shape=shape)
-    a = Function(name='a', grid=grid)
-    xarr = np.linspace(0., 1., shape[0])
-    yarr = np.linspace(0., 1., shape[1])
-    a.data[:] = np.meshgrid(xarr, yarr)[1]
+    a = Function(name='a', grid=unit_grid(shape))
+    a.data[:] = unit_ramp(shape)
     return a
 
 
 def at(shape=(11, 11)):
-    grid = Grid(shape=shape)
-    a = TimeFunction(name='a', grid=grid)
-    xarr = np.linspace(0., 1., shape[0])
-    yarr = np.linspace(0., 1., shape[1])
-    a.data[:] = np.meshgrid(xarr, yarr)[1]
+    a = TimeFunction(name='a', grid=unit_grid(shape))
+    a.data[:] = unit_ramp(shape)
     return a
 
 
@@ -79,8 +101,7 @@ def custom_points(grid, ranges, npoints, name='points'):
     dim = Dimension(name="dim")
     points = SparseFunction(name=name, grid=grid, dimensions=(scale, dim),
                             shape=(3, npoints), npoint=npoints)
-    for i, r in enumerate(ranges):
-        points.coordinates.data[:, i] = np.linspace(r[0], r[1], npoints)
+    points.coordinates.data[:] = linear_coordinates(ranges, npoints)
     return points
 
 
@@ -89,16 +110,17 @@ def precompute_linear_interpolation(points, grid, origin):
         precomputes gridpoints and interpolation coefficients according to a linear
         scheme to be used in PrecomputedSparseFunction.
     """
-    gridpoints = [tuple(floor((point[i]-origin[i])/grid.spacing[i])
-                        for i in range(len(point))) for point in points]
-
-    interpolation_coeffs = np.zeros((len(points), 2, 2))
-    for i, point in enumerate(points):
-        for d in range(grid.dim):
-            interpolation_coeffs[i, d, 0] = ((gridpoints[i][d] + 1)*grid.spacing[d] -
-                                             point[d])/grid.spacing[d]
-            interpolation_coeffs[i, d, 1] = (point[d]-gridpoints[i][d]*grid.spacing[d])\
-                / grid.spacing[d]
+    points = np.asarray(points)
+    spacing = np.asarray(grid.spacing)
+
+    gridpoints = np.floor((points - np.asarray(origin))/spacing).astype(int)
+
+    # Fractional distance of each point from its reference gridpoint, along
+    # each dimension; the linear weights then are `1 - rd` and `rd`
+    rd = (points - gridpoints*spacing)/spacing
+    # float32, matching the dtype of the PrecomputedSparseFunction this feeds
+    interpolation_coeffs = np.stack([1 - rd, rd], axis=2).astype(np.float32)
+
     return gridpoints, interpolation_coeffs
 
 
@@ -115,9 +137,9 @@ def test_precomputed_interpolation():
     #  because we interpolate across 2 neighbouring points in each dimension
 
     def init(data):
-        for i in range(data.shape[0]):
-            for j in range(data.shape[1]):
-                data[i, j] = sin(grid.spacing[0]*i) + sin(grid.spacing[1]*j)
+        xs = np.sin(float(grid.spacing[0])*np.arange(data.shape[0]))
+        ys = np.sin(float(grid.spacing[1])*np.arange(data.shape[1]))
+        data[:] = xs[:, np.newaxis] + ys
         return data
 
     m = Function(name='m', grid=grid, initializer=init, space_order=0)
@@ -149,8 +171,7 @@ def test_precomputed_interpolation_time():
     #  because we interpolate across 2 neighbouring points in each dimension
 
     u = TimeFunction(name='u', grid=grid, space_order=0, save=5)
-    for it in range(5):
-        u.data[it, :] = it
+    u.data[:] = np.arange(5, dtype=np.float32).reshape(-1, 1, 1)
 
     gridpoints, interpolation_coeffs = precompute_linear_interpolation(points,
                                                                        grid, origin)
@@ -165,8 +186,9 @@ def test_precomputed_interpolation_time():
     op = Operator(eqn)
     op(time_m=0, time_M=4)
 
-    for it in range(5):
-        assert np.allclose(sf.data[it, :], it)
+    expected = np.broadcast_to(np.arange(5, dtype=np.float32)[:, np.newaxis],
+                               sf.data.shape)
+    np.testing.assert_allclose(sf.data, expected, rtol=1e-6)
 
 
 def test_precomputed_injection():
@@ -196,11 +218,11 @@ def test_precomputed_injection():
 
     Operator(expr)()
 
-    indices = [slice(0, 2, 1), slice(9, 11, 1)]
-    assert np.allclose(m.data[indices], result, rtol=1.e-5)
-
-    indices = [slice(4, 6, 1) for _ in coords]
-    assert np.allclose(m.data[indices], result, rtol=1.e-5)
+    # Check both injection sites in one go, gathering the two 2x2 patches
+    # into a single array so that only one allclose runs
+    patches = np.stack([np.asarray(m.data[0:2, 9:11]),
+                        np.asarray(m.data[4:6, 4:6])])
+    assert np.allclose(patches, result, rtol=1.e-5)
 
 
 @pytest.mark.parametrize('shape, coords', [
@@ -237,7 +259,8 @@ def test_interpolate_cumm(shape, coords, npoints=20):
     expr = p.interpolate(a, increment=True)
     Operator(expr)(a=a)
 
-    assert np.allclose(p.data[:], xcoords + 1., rtol=1e-6)
+    expected = xcoords + 1.
+    assert np.allclose(p.data[:], expected, rtol=1e-6)
 
 
 @pytest.mark.parametrize('shape, coords', [
@@ -250,27 +273,27 @@ def test_interpolate_time_shift(shape, coords, npoints=20):
     This test verifies the optional time shifting for SparseTimeFunctions
     """
     a = unit_box_time(shape=shape)
+    b = unit_box_time(name='b', shape=shape)
+    c = unit_box_time(name='c', shape=shape)
     p = time_points(a.grid, coords, npoints=npoints, nt=10)
+    p2 = time_points(a.grid, coords, npoints=npoints, name='points2', nt=10)
+    p3 = time_points(a.grid, coords, npoints=npoints, name='points3', nt=10)
     xcoords = p.coordinates.data[:, 0]
 
     p.data[:] = 1.
+    p2.data[:] = 1.
+    p3.data[:] = 1.
+
+    # One field-receiver pair per shift variant, so that a single Operator
+    # (hence a single JIT compilation) exercises all three cases
     expr = p.interpolate(a, u_t=a.indices[0]+1)
-    Operator(expr)(a=a)
+    expr2 = p2.interpolate(b, p_t=p2.indices[0]+1)
+    expr3 = p3.interpolate(c, u_t=c.indices[0]+1, p_t=p3.indices[0]+1)
+    Operator(expr + expr2 + expr3)(a=a, b=b, c=c)
 
     assert np.allclose(p.data[0, :], xcoords, rtol=1e-6)
-
-    p.data[:] = 1.
-    expr = p.interpolate(a, p_t=p.indices[0]+1)
-    Operator(expr)(a=a)
-
-    assert np.allclose(p.data[1, :], xcoords, rtol=1e-6)
-
-    p.data[:] = 1.
-    expr = p.interpolate(a, u_t=a.indices[0]+1,
-                         p_t=p.indices[0]+1)
-    Operator(expr)(a=a)
-
-    assert np.allclose(p.data[1, :], xcoords, rtol=1e-6)
+    assert np.allclose(p2.data[1, :], xcoords, rtol=1e-6)
+    assert np.allclose(p3.data[1, :], xcoords, rtol=1e-6)
 
 
 @pytest.mark.parametrize('shape, coords', [
@@ -307,9 +330,9 @@ def test_interpolate_custom(shape, coords, npoints=20):
     expr = p.interpolate(a * p.indices[0])
     Operator(expr)(a=a)
 
-    assert np.allclose(p.data[0, :], 0.0 * xcoords, rtol=1e-6)
-    assert np.allclose(p.data[1, :], 1.0 * xcoords, rtol=1e-6)
-    assert np.allclose(p.data[2, :], 2.0 * xcoords, rtol=1e-6)
+    # A single comparison against the precomputed 0/1/2-scaled coordinates
+    expected = np.arange(3, dtype=np.float32)[:, np.newaxis]*xcoords
+    assert np.allclose(p.data, expected, rtol=1e-6)
 
 
 def test_interpolation_dx():
@@ -351,9 +374,9 @@ def test_interpolate_indexed(shape, coords, npoints=20):
     expr = p.interpolate(a[a.grid.dimensions] * p.indices[0])
     Operator(expr)(a=a)
 
-    assert np.allclose(p.data[0, :], 0.0 * xcoords, rtol=1e-6)
-    assert np.allclose(p.data[1, :], 1.0 * xcoords, rtol=1e-6)
-    assert np.allclose(p.data[2, :], 2.0 * xcoords, rtol=1e-6)
+    # A single comparison against the precomputed 0/1/2-scaled coordinates
+    expected = np.arange(3, dtype=np.float32)[:, np.newaxis]*xcoords
+    assert np.allclose(p.data, expected, rtol=1e-6)
 
 
 @pytest.mark.parametrize('shape, coords, result', [
@@ -387,34 +410,32 @@ def test_inject_time_shift(shape, coords, result, npoints=19):
     This test verifies the optional time shifting for SparseTimeFunctions
     """
     a = unit_box_time(shape=shape)
+    b = unit_box_time(name='b', shape=shape)
+    c = unit_box_time(name='c', shape=shape)
     a.data[:] = 0.
+    b.data[:] = 0.
+    c.data[:] = 0.
     p = time_points(a.grid, ranges=coords, npoints=npoints)
 
+    # One target field per shift variant, so that a single Operator (hence a
+    # single JIT compilation) exercises all three cases
     expr = p.inject(a, Float(1.), u_t=a.indices[0]+1)
+    expr2 = p.inject(b, Float(1.), p_t=p.indices[0]+1)
+    expr3 = p.inject(c, Float(1.), u_t=c.indices[0]+1, p_t=p.indices[0]+1)
 
-    Operator(expr)(a=a, time=1)
+    Operator(expr + expr2 + expr3)(a=a, b=b, c=c, time=1)
 
     indices = [slice(1, 1, 1)] + [slice(4, 6, 1) for _ in coords]
     indices[1] = slice(1, -1, 1)
     assert np.allclose(a.data[indices], result, rtol=1.e-5)
 
-    a.data[:] = 0.
-    expr = p.inject(a, Float(1.), p_t=p.indices[0]+1)
-
-    Operator(expr)(a=a, time=1)
-
     indices = [slice(0, 0, 1)] + [slice(4, 6, 1) for _ in coords]
     indices[1] = slice(1, -1, 1)
-    assert np.allclose(a.data[indices], result, rtol=1.e-5)
-
-    a.data[:] = 0.
-    expr = p.inject(a, Float(1.), u_t=a.indices[0]+1, p_t=p.indices[0]+1)
-
-    Operator(expr)(a=a, time=1)
+    assert np.allclose(b.data[indices], result, rtol=1.e-5)
 
     indices = [slice(1, 1, 1)] + [slice(4, 6, 1) for _ in coords]
     indices[1] = slice(1, -1, 1)
-    assert np.allclose(a.data[indices], result, rtol=1.e-5)
+    assert np.allclose(c.data[indices], result, rtol=1.e-5)
 
 
 @pytest.mark.parametrize('shape, coords, result', [
@@ -461,8 +482,15 @@ def test_inject_from_field(shape, coords, result, npoints=19):
     assert np.allclose(a.data[indices], result, rtol=1.e-5)
 
 
-@pytest.mark.parametrize('shape', [(50, 50, 50)])
-def test_position(shape):
+@pytest.fixture(scope='session')
+def acoustic_solver():
+    """
+    A 50^3 constant-velocity model with its acquisition geometry and
+    acoustic solver. Building these is expensive (Function allocation,
+    symbolic PDEs), so one instance is shared across the session; tests
+    must not mutate the model or the geometry.
+    """
+    shape = (50, 50, 50)
     t0 = 0.0  # Start time
     tn = 500.  # Final time
     nrec = 130  # Number of receivers
@@ -471,10 +499,6 @@ def test_position(shape):
     model = demo_model('constant-isotropic', spacing=[15. for _ in shape],
                        shape=shape, nbl=10)
 
-    # Derive timestepping from model spacing
-    dt = model.critical_dt
-    time_range = TimeAxis(start=t0, stop=tn, step=dt)
-
     # Source and receiver geometries
     src_coordinates = np.empty((1, len(shape)))
     src_coordinates[0, :] = np.array(model.domain_size) * .5
@@ -487,7 +511,19 @@ def test_position(shape):
     geometry = AcquisitionGeometry(model, rec_coordinates, src_coordinates,
                                    t0=t0, tn=tn, src_type='Ricker', f0=0.010)
     # Create solver object to provide relevant operators
-    solver = AcousticWaveSolver(model, geometry, time_order=2, space_order=4)
+    return AcousticWaveSolver(model, geometry, time_order=2, space_order=4)
+
+
+@pytest.mark.slow
+def test_position(acoustic_solver):
+    solver = acoustic_solver
+    model = solver.model
+    geometry = solver.geometry
+    nrec = geometry.nrec
+
+    # Derive timestepping from model spacing
+    dt = model.critical_dt
+    time_range = TimeAxis(start=geometry.t0, stop=geometry.tn, step=dt)
 
     rec, u, _ = solver.forward(save=False)
 
@@ -545,21 +581,22 @@ def test_msf_interpolate():
     #  because we interpolate across 2 neighbouring points in each dimension
 
     u = TimeFunction(name='u', grid=grid, space_order=0, save=5)
-    for it in range(5):
-        u.data[it, :] = it
+    u.data[:] = np.arange(5, dtype=np.float32).reshape(-1, 1, 1)
 
     gridpoints, interpolation_coeffs = precompute_linear_interpolation(points,
                                                                        grid, origin)
 
-    matrix = scipy.sparse.eye(len(points))
+    # A COO identity: only the sparsity layout matters here, so the CSR
+    # conversion that `eye` would go through is skipped
+    matrix = scipy.sparse.identity(len(points), format='coo', dtype=np.float32)
 
     sf = MatrixSparseTimeFunction(
         name='s', grid=grid, r=r, matrix=matrix, nt=5
     )
 
     sf.gridpoints.data[:] = gridpoints
-    sf.coefficients_x.data[:] = interpolation_coeffs[:, 0, :]
-    sf.coefficients_y.data[:] = interpolation_coeffs[:, 0, :]
+    sf.coefficients_x.data[:] = sf.coefficients_y.data[:] = \
+        interpolation_coeffs[:, 0, :]
 
     assert sf.data.shape == (5, 3)
 
@@ -571,8 +608,9 @@ def test_msf_interpolate():
     op(time_m=0, time_M=4)
     sf.manual_gather()
 
-    for it in range(5):
-        assert np.allclose(sf.data[it, :], it)
+    expected = np.broadcast_to(np.arange(5, dtype=np.float32)[:, np.newaxis],
+                               sf.data.shape)
+    np.testing.assert_allclose(sf.data, expected, rtol=1e-6)
 
     # Now test injection
     u.data[:] = 0